@@ -6,6 +6,12 @@ from typing import NoReturn
 from datetime import datetime
 import discord
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows - fall back to the default asyncio loop
+    uvloop = None
+
 # Fix Windows console encoding for emoji support
 if sys.platform == "win32":
     import codecs
@@ -21,15 +27,20 @@ from src.ai.model_manager import ModelManager
 from chromadb.errors import ChromaError
 
 
-async def main() -> None:
+async def main() -> int:
     """Main execution flow - orchestrates the Discord bot.
 
     Sets up logging, creates bot instance, configures event handlers,
     and starts the Discord connection with proper error handling and cleanup.
+
+    Returns:
+        Process exit code: 1 if an event handler requested a fatal shutdown, 0 otherwise
     """
     logger = logging.getLogger(__name__)
     cleanup_manager = None
     bot = None
+    start_task = None
+    exit_code = 0
 
     # Setup logging with file output
     log_level = logging.INFO if settings.DEBUG else logging.WARNING
@@ -54,6 +65,12 @@ async def main() -> None:
     logger.info(f"Logging to file: {log_filepath}")
     logger.info("🚀 Starting Discord Indexer Bot...")
 
+    # Run tasks eagerly so handlers that return without awaiting (ignored messages,
+    # command prefixes) never get scheduled on the loop. Only available on Python 3.12+.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        logger.info("Eager task factory enabled")
+
     try:
         # Initialize database and configuration tables
         logger.info("🗄️ Initializing database and configuration tables...")
@@ -113,9 +130,20 @@ async def main() -> None:
         logger.info("⚙️ Setting up event handlers...")
         setup_bot_actions(bot)
 
-        # Start bot with token
+        # Start bot with token and run until it disconnects or a handler requests shutdown
         logger.info("🔐 Connecting to Discord...")
-        await bot.start(settings.DISCORD_TOKEN)
+        start_task = asyncio.create_task(bot.start(settings.DISCORD_TOKEN))
+        shutdown_task = asyncio.create_task(bot.shutdown_event.wait())
+        done, _ = await asyncio.wait(
+            {start_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if shutdown_task in done:
+            logger.critical(f"🛑 Fatal shutdown requested: {bot.shutdown_reason}")
+            exit_code = 1
+        else:
+            shutdown_task.cancel()
+            start_task.result()  # Re-raise connection errors from bot.start()
 
     except KeyboardInterrupt:
         logger.info("🛑 Bot stopped by user")
@@ -142,8 +170,15 @@ async def main() -> None:
             except Exception as fallback_error:
                 logger.error(f"Error during fallback cleanup: {fallback_error}")
 
+        # bot.start() returns once the connection is closed; cancel it if it has not
+        if start_task is not None and not start_task.done():
+            start_task.cancel()
+            await asyncio.gather(start_task, return_exceptions=True)
+
         logger.info("🔚 Bot shutdown sequence completed")
 
+    return exit_code
+
 
 if __name__ == "__main__":
     print("=" * 50)
@@ -151,4 +186,8 @@ if __name__ == "__main__":
     print("Building foundation for AI-powered search")
     print("=" * 50)
 
-    asyncio.run(main())
+    # Install the libuv-backed event loop before any loop is created
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    sys.exit(asyncio.run(main()))
@@ -78,7 +78,7 @@ class ConversationQueue:
         """Check if user already has a request queued or processing."""
         return user_id in self._active_requests
     
-    async def add_request(self, user_id: str, server_id: str, message: str, discord_message_id: Optional[int] = None, discord_channel=None) -> bool:
+    async def add_request(self, user_id: str, server_id: str, message: str, discord_message_id: Optional[int] = None, discord_channel=None) -> Optional[ConversationRequest]:
         """Add a conversation request to the queue.
         
         Args:
@@ -89,17 +89,17 @@ class ConversationQueue:
             discord_channel: Optional Discord channel for status updates
             
         Returns:
-            True if request added successfully, False if rejected
+            The queued request (callers may attach a status_message_id), or None if rejected
         """
         # Anti-spam protection: Check if user already has active request
         if self.is_user_queued(user_id):
             logger.warning(f"User {user_id} already has active request, rejecting new request")
-            return False
+            return None
         
         # Check if queue is full
         if self._queue.full():
             logger.warning(f"Queue is full ({self.max_queue_size}), rejecting request from user {user_id}")
-            return False
+            return None
         
         # Create and queue request
         request = ConversationRequest(
@@ -117,11 +117,11 @@ class ConversationQueue:
             self._queue_order.append(user_id)  # Track queue position
             
             logger.info(f"Added request to queue: user {user_id}, queue size: {self.get_queue_size()}")
-            return True
+            return request
             
         except asyncio.QueueFull:
             logger.error(f"Queue unexpectedly full when adding request for user {user_id}")
-            return False
+            return None
     
     async def get_next_request(self) -> Optional[ConversationRequest]:
         """Get the next request from queue for processing.
@@ -1,21 +1,101 @@
 import discord
 import asyncio
 from discord.ext import commands
+import functools
 import logging
-import sys
 import os
+import random
 import re
+import threading
+import time
 from typing import TYPE_CHECKING
-from typing import List, Optional
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-from src.message_processing import MessagePipeline
-from src.setup import configure_all_servers, is_server_configured
+from chromadb.errors import ChromaError, NotFoundError
+from src.message_processing import MIN_INDEXABLE_CONTENT_LENGTH, MessagePipeline
+from src.setup import (
+    configure_all_servers,
+    filter_configured_servers,
+    is_server_configured,
+)
 from src.ai.agents.langchain_dm_assistant import LangChainDMAssistant
 from src.ai.agents.queue_worker import initialize_queue_worker
 from src.db.setup_db import get_db
 from src.db.conversation_db import get_conversation_db
 from src.ai.agents.conversation_queue import get_conversation_queue
+from src.exceptions.message_processing import (
+    MessageProcessingError,
+    DatabaseConnectionError,
+    LLMProcessingError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Real-time messages are coalesced into batches of at most this many messages
+REALTIME_BATCH_MAX_SIZE = 64
+# How long the flusher keeps collecting after the first message of a batch
+REALTIME_BATCH_WINDOW_SECONDS = 0.02
+# Queue fill ratio at which Random Early Drop starts shedding real-time messages
+REALTIME_EARLY_DROP_THRESHOLD = 0.8
+
+# "!ask [server] question" - DOTALL keeps multi-line questions whole
+_SERVER_SELECTION_RE = re.compile(r"\[([^\]]+)\]\s*(.*)", re.DOTALL)
+
+# How long a server's message count and last-indexed time are reused by !ask
+SERVER_INDEX_CACHE_TTL_SECONDS = 60.0
+# Longest a server's index probe may run before !ask leaves the server out
+SERVER_PROBE_TIMEOUT_SECONDS = 2.0
+# Longest !ask waits for a free probe slot (only reached when other probes are hung)
+SERVER_PROBE_QUEUE_TIMEOUT_SECONDS = 10.0
+# Index probes allowed to run at once
+SERVER_PROBE_MAX_WORKERS = 4
+# Per-server ChromaDB directories live under src/db/databases (resolved once, independent of cwd)
+_DATABASES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "databases"
+)
+
+# Discord rejects plain messages longer than this
+DISCORD_MESSAGE_MAX_LENGTH = 2000
+
+# Reply to non-command DMs
+_DM_GUIDANCE_REPLY = (
+    "👋 Hello! I'm the Discord Indexer Bot.\n\n"
+    "To ask me a question, use:\n"
+    "• `!ask <your question>` - Ask me anything about your servers\n"
+    "• `!help` - Show all available commands\n"
+    "• `!status` - Show bot status\n\n"
+    "Each `!ask` command is processed independently in a fair queue.\n"
+    "Your conversation history is preserved in the database for context.\n\n"
+    "Note: Only server messages are indexed. DMs are private and never stored."
+)
+
+# !ask reply when shared servers could not be checked before SERVER_PROBE_TIMEOUT_SECONDS
+_SERVERS_UNCHECKED_REPLY = (
+    "⏳ **Servers Busy**: I couldn't check some of the servers we share in time. "
+    "Please try again in a moment."
+)
+
+# Static command error replies
+_COMMAND_NOT_FOUND_REPLY = "❓ **Command not found!**\nUse `!help` to see available commands."
+_MISSING_ARGUMENT_REPLY = (
+    "❌ **Missing required argument!**\n"
+    "Use `!help` for command usage information."
+)
+_BAD_ARGUMENT_REPLY = "❌ **Invalid argument!**\nUse `!help` for command usage information."
+_COMMAND_ON_COOLDOWN_REPLY = "⏰ **Command on cooldown!**\nTry again in {retry_after:.1f} seconds."
+_UNEXPECTED_ERROR_REPLY = (
+    "❌ **An unexpected error occurred!**\n"
+    "The error has been logged for investigation."
+)
+
+# Static replies keyed by command error type (CommandOnCooldown needs retry_after, so it is handled inline)
+_COMMAND_ERROR_REPLIES = {
+    commands.CommandNotFound: _COMMAND_NOT_FOUND_REPLY,
+    commands.MissingRequiredArgument: _MISSING_ARGUMENT_REPLY,
+    commands.BadArgument: _BAD_ARGUMENT_REPLY,
+}
 
 
 @dataclass
@@ -28,10 +108,43 @@ class ServerOption:
     message_count: int = 0
 
 
+@dataclass
+class _ServerProbe:
+    """Index probe for one server, shared by every !ask that needs it."""
+
+    task: "asyncio.Task[Tuple[int, datetime]]"
+    started: asyncio.Future  # Resolves to the monotonic time the probe got a slot
+
+
 if TYPE_CHECKING:
     from src.bot.client import DiscordBot
 
 
+# server_id -> (monotonic time cached, message count, last indexed time)
+_server_index_cache: Dict[str, Tuple[float, int, datetime]] = {}
+
+# Probes run on their own daemon threads, at most SERVER_PROBE_MAX_WORKERS at a time. A hung
+# ChromaDB directory then only holds a probe slot - never the default executor that embedding
+# and LLM calls run on - and, unlike executor threads, cannot block interpreter exit
+_server_probe_slots = asyncio.Semaphore(SERVER_PROBE_MAX_WORKERS)
+# server_id -> latest probe; one still running after a timeout is awaited again, not restarted
+_server_probes: Dict[str, "_ServerProbe"] = {}
+
+# Errors a probe can hit on a missing, locked or corrupt server database
+_SERVER_PROBE_ERRORS = (
+    OSError,
+    FileNotFoundError,
+    PermissionError,
+    ValueError,
+    ImportError,
+    AttributeError,
+    KeyError,
+    TypeError,
+    RuntimeError,
+    ChromaError,
+)
+
+
 async def on_ready_handler(bot: "DiscordBot") -> None:
     """Handle bot ready event - start historical processing and real-time monitoring.
 
@@ -40,17 +153,17 @@ async def on_ready_handler(bot: "DiscordBot") -> None:
     Args:
         bot: DiscordBot instance with message processing capabilities
     """
-    logger = logging.getLogger(__name__)
-
-    # Log guild connection information (replicated from client.py to avoid circular calls)
-    logger.info(f"{bot.user} has connected to Discord!")
-    logger.info(f"Bot is in {len(bot.guilds)} guild(s)")
+    # Log guild connection information
+    logger.info("%s has connected to Discord!", bot.user)
+    logger.info("Bot is in %d guild(s)", len(bot.guilds))
 
     # Log available guilds and channels
     for guild in bot.guilds:
-        logger.info(f"Connected to guild: {guild.name} (ID: {guild.id})")
-        logger.debug(f"  - Text channels: {len(guild.text_channels)}")
-        logger.debug(f"  - Total channels: {len(guild.channels)}")
+        logger.info("Connected to guild: %s (ID: %s)", guild.name, guild.id)
+        logger.debug("  - Text channels: %d", len(guild.text_channels))
+        logger.debug("  - Total channels: %d", len(guild.channels))
+
+    bot.refresh_channel_counts()
 
     logger.info("=== Bot is ready! Starting server configuration... ===")
     
@@ -70,6 +183,11 @@ async def on_ready_handler(bot: "DiscordBot") -> None:
     bot.message_pipeline = MessagePipeline(completion_event=bot.pipeline_ready)
     logger.info("✅ Message pipeline initialized successfully")
 
+    # Start draining real-time messages into the pipeline (only once across reconnects)
+    if bot.realtime_flusher_task is None or bot.realtime_flusher_task.done():
+        _start_realtime_flusher(bot)
+        logger.info("✅ Real-time batch flusher started")
+
     # Initialize LangChain DMAssistant for conversation handling
     logger.info("🤖 Initializing LangChain DMAssistant...")
     try:
@@ -108,26 +226,446 @@ async def on_ready_handler(bot: "DiscordBot") -> None:
         logger.info("✅ LangChain queue worker started successfully")
 
     except (ImportError, RuntimeError, ConnectionError, OSError) as e:
-        logger.critical(f"❌ Failed to initialize DMAssistant: {e}")
-        logger.critical("🛑 Shutting down - DMAssistant is required for bot operation")
-        await bot.close()
-        sys.exit(1)
+        await _fatal_shutdown(
+            bot,
+            f"❌ Failed to initialize DMAssistant: {e}",
+            "🛑 Shutting down - DMAssistant is required for bot operation",
+        )
+        return
 
     # Process historical messages through pipeline
     logger.info("📜 Starting historical message processing through pipeline...")
     historical_success = await bot.resume_indexing_from_checkpoints()
+    invalidate_server_cache()
 
     if historical_success:
         logger.info("✅ Historical message processing completed successfully")
         logger.info("📡 Now monitoring for new real-time messages...")
 
         # Log available channels for info
-        channels = bot.get_all_channels()
-        logger.info(f"📡 Monitoring {len(channels)} channels for new messages")
+        logger.info("📡 Monitoring %d channels for new messages", bot.text_channel_count)
+    else:
+        await _fatal_shutdown(bot, "❌ Historical message processing failed - shutting down")
+
+
+async def _fatal_shutdown(bot: "DiscordBot", *reasons: str) -> None:
+    """Log why the bot cannot continue and signal main() to shut it down.
+
+    Closing the bot and exiting is left to main(), so cleanup runs once and
+    no SystemExit is raised from inside a discord.py event task.
+
+    Args:
+        bot: DiscordBot instance to shut down
+        *reasons: Messages logged at CRITICAL level before shutting down
+    """
+    for reason in reasons:
+        logger.critical(reason)
+    if bot.shutdown_reason is None:
+        bot.shutdown_reason = reasons[0] if reasons else "fatal error"
+    bot.shutdown_event.set()
+
+
+def _spawn_background_task(bot: "DiscordBot", coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Schedule a fire-and-forget coroutine and keep it referenced until it finishes.
+
+    The event loop only holds weak references to tasks, so an unreferenced task
+    can be garbage collected mid-flight. Tracked tasks are cancelled in bot.close().
+
+    Args:
+        bot: DiscordBot instance that owns the task set
+        coro: Coroutine to run in the background
+
+    Returns:
+        The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    bot.background_tasks.add(task)
+    task.add_done_callback(bot.background_tasks.discard)
+    return task
+
+
+def _start_realtime_flusher(bot: "DiscordBot") -> None:
+    """Start the real-time batch flusher and restart it if it ever crashes.
+
+    Args:
+        bot: DiscordBot instance owning the real-time queue
+    """
+    bot.realtime_flusher_task = _spawn_background_task(bot, _realtime_batch_flusher(bot))
+    bot.realtime_flusher_task.add_done_callback(
+        functools.partial(_on_realtime_flusher_done, bot)
+    )
+
+
+def _on_realtime_flusher_done(bot: "DiscordBot", task: asyncio.Task) -> None:
+    """Log an unexpected flusher exit and start a replacement.
+
+    Without a running flusher the real-time queue only fills up, and Random
+    Early Drop then discards every new message. Cancellation during
+    bot.close() is the only expected way for the flusher to end.
+
+    Args:
+        bot: DiscordBot instance owning the flusher
+        task: The finished flusher task
+    """
+    if task.cancelled() or bot.is_closed() or bot.realtime_flusher_task is not task:
+        return
+
+    logger.error(
+        "Real-time batch flusher stopped unexpectedly - restarting it",
+        exc_info=task.exception(),
+    )
+    _start_realtime_flusher(bot)
+
+
+def _early_drop_probability(queue_size: int, max_size: int) -> float:
+    """Get the Random Early Drop probability for the real-time queue.
+
+    Ramps linearly from 0 at REALTIME_EARLY_DROP_THRESHOLD fill to 1 when full.
+
+    Args:
+        queue_size: Current number of queued messages
+        max_size: Queue capacity
+
+    Returns:
+        Probability in [0, 1] that the next message should be dropped
+    """
+    fill_ratio = queue_size / max_size
+    if fill_ratio < REALTIME_EARLY_DROP_THRESHOLD:
+        return 0.0
+    return min(1.0, (fill_ratio - REALTIME_EARLY_DROP_THRESHOLD) / (1.0 - REALTIME_EARLY_DROP_THRESHOLD))
+
+
+async def _realtime_batch_flusher(bot: "DiscordBot") -> None:
+    """Drain real-time messages from the bot queue and submit them in batches.
+
+    Waits for the first queued message, keeps collecting for
+    REALTIME_BATCH_WINDOW_SECONDS, then submits up to REALTIME_BATCH_MAX_SIZE
+    messages to the pipeline in a single call. Messages are only ever taken
+    with get_nowait() after the window, so no item can be lost to a timeout.
+    A pipeline error fails only the current batch: it is logged and the
+    flusher moves on, keeping the Discord connection and caches warm instead
+    of shutting down. The batch is not retried: the pipeline only raises its
+    own errors when a server's error handling is set to 'stop', and a rerun
+    would override that setting and repeat the LLM work. Any other
+    exception ends the task; _on_realtime_flusher_done logs it and
+    starts a new flusher so the queue keeps draining.
+
+    Args:
+        bot: DiscordBot instance owning the real-time queue and pipeline
+    """
+    queue = bot.realtime_queue
+
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(REALTIME_BATCH_WINDOW_SECONDS)
+        while len(batch) < REALTIME_BATCH_MAX_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+
+        try:
+            success = await bot.send_batch_to_pipeline(batch)
+
+            if success:
+                logger.info("Successfully processed real-time batch of %d messages", len(batch))
+                for server_id in {str(msg["guild"]["id"]) for msg in batch}:
+                    invalidate_server_cache(server_id)
+            else:
+                logger.warning("Real-time batch of %d messages failed processing", len(batch))
+
+        except (MessageProcessingError, DatabaseConnectionError, LLMProcessingError,
+                RuntimeError, OSError) as e:
+            logger.error("Failed to process real-time batch of %d messages: %s", len(batch), e)
+            # Don't crash the flusher on processing errors. The failed run never
+            # released the pipeline, so mark it ready again for the next batch.
+            bot.pipeline_ready.set()
+
+
+def invalidate_server_cache(server_id: Optional[str] = None) -> None:
+    """Drop cached indexing data so the next !ask re-reads it from ChromaDB.
+
+    Args:
+        server_id: Server whose entry to drop, or None to clear every server
+    """
+    if server_id is None:
+        _server_index_cache.clear()
+    else:
+        _server_index_cache.pop(server_id, None)
+
+
+def _probe_server_index(server_id: str) -> Tuple[int, datetime]:
+    """Read a server's indexed message count and last indexed time from disk.
+
+    Args:
+        server_id: Discord server ID
+
+    Returns:
+        Tuple of (message count, last indexed time); count is 0 without a database
+    """
+    db_path = os.path.join(_DATABASES_DIR, server_id, "chroma_data")
+
+    # One stat call both checks the database exists and provides its mtime
+    try:
+        db_stat = os.stat(db_path)
+    except FileNotFoundError:
+        return 0, datetime.now()
+
+    # Use directory modification time as proxy for the last indexed date
+    last_indexed = datetime.fromtimestamp(db_stat.st_mtime)
+
+    # Read-only lookup: listing servers must never create an empty collection
+    client = get_db(int(server_id))
+    try:
+        collection = client.get_collection(name="messages")
+    except (NotFoundError, ValueError):
+        # Database directory exists but nothing has been stored yet
+        return 0, last_indexed
+
+    return collection.count(), last_indexed
+
+
+def _resolve_future(future: asyncio.Future, outcome: Any) -> None:
+    """Complete a future with a result or exception unless it was cancelled.
+
+    Args:
+        future: Future to complete
+        outcome: Result value, or the exception to raise from the future
+    """
+    if future.done():
+        return
+    if isinstance(outcome, BaseException):
+        future.set_exception(outcome)
     else:
-        logger.critical("❌ Historical message processing failed - shutting down")
-        await bot.close()
-        sys.exit(1)
+        future.set_result(outcome)
+
+
+def _probe_server_in_thread(
+    server_id: str, loop: asyncio.AbstractEventLoop, future: asyncio.Future
+) -> None:
+    """Thread target: probe a server and hand the outcome back to the event loop.
+
+    Args:
+        server_id: Discord server ID
+        loop: Event loop that owns future
+        future: Future to complete with the probe result
+    """
+    # Reported if the probe dies with an error outside _SERVER_PROBE_ERRORS
+    outcome: Any = RuntimeError(f"Index probe for server {server_id} failed")
+    try:
+        outcome = _probe_server_index(server_id)
+    except _SERVER_PROBE_ERRORS as e:
+        outcome = e
+    finally:
+        try:
+            loop.call_soon_threadsafe(_resolve_future, future, outcome)
+        except RuntimeError:
+            # Event loop already closed during shutdown - nobody is waiting
+            pass
+
+
+async def _run_server_probe(
+    server_id: str, started: asyncio.Future
+) -> Tuple[int, datetime]:
+    """Probe a server on a daemon thread once a probe slot is free.
+
+    Args:
+        server_id: Discord server ID
+        started: Future resolved with the monotonic start time once a slot is free
+
+    Returns:
+        Tuple of (message count, last indexed time)
+    """
+    async with _server_probe_slots:
+        started.set_result(time.monotonic())
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        threading.Thread(
+            target=_probe_server_in_thread,
+            args=(server_id, loop, future),
+            name=f"server-probe-{server_id}",
+            daemon=True,
+        ).start()
+        return await future
+
+
+def _cache_server_probe_result(server_id: str, task: asyncio.Task) -> None:
+    """Cache a finished probe's result, including one that finished after its !ask timed out.
+
+    Args:
+        server_id: Discord server ID
+        task: The finished probe task
+    """
+    if task.cancelled() or task.exception() is not None:
+        return
+    _server_index_cache[server_id] = (time.monotonic(), *task.result())
+
+
+def _submit_server_probe(server_id: str) -> _ServerProbe:
+    """Start an index probe for a server, reusing one that is still pending.
+
+    A probe that timed out earlier keeps running in its thread. Reusing it
+    means a hung server holds at most one probe slot however often !ask runs.
+
+    Args:
+        server_id: Discord server ID
+
+    Returns:
+        The server's pending or newly started probe
+    """
+    probe = _server_probes.get(server_id)
+    if probe is None or probe.task.done():
+        started = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(_run_server_probe(server_id, started))
+        task.add_done_callback(functools.partial(_cache_server_probe_result, server_id))
+        probe = _ServerProbe(task=task, started=started)
+        _server_probes[server_id] = probe
+    return probe
+
+
+async def _await_server_probe(server_id: str) -> Tuple[int, datetime]:
+    """Wait for a server's probe, timing only its own run.
+
+    Time spent waiting for a free slot does not count against
+    SERVER_PROBE_TIMEOUT_SECONDS, so healthy servers queued behind others
+    are not reported as timed out. Both waits are shielded: a timeout here
+    never cancels a probe that another !ask shares or that is still queued.
+
+    Args:
+        server_id: Discord server ID
+
+    Returns:
+        Tuple of (message count, last indexed time)
+
+    Raises:
+        asyncio.TimeoutError: If no slot freed up in time or the probe ran too long
+    """
+    probe = _submit_server_probe(server_id)
+    started_at = await asyncio.wait_for(
+        asyncio.shield(probe.started), SERVER_PROBE_QUEUE_TIMEOUT_SECONDS
+    )
+    remaining = SERVER_PROBE_TIMEOUT_SECONDS - (time.monotonic() - started_at)
+    return await asyncio.wait_for(asyncio.shield(probe.task), max(remaining, 0.0))
+
+
+async def _get_mutual_servers_with_data(
+    bot: "DiscordBot", user_id: int
+) -> Tuple[List[ServerOption], List[str]]:
+    """Get servers shared between bot and user, with indexing data.
+
+    Indexing data is cached per server for SERVER_INDEX_CACHE_TTL_SECONDS and
+    dropped early by invalidate_server_cache() when new messages are stored.
+    Cache misses are probed concurrently on daemon threads so the disk and
+    ChromaDB reads never block the event loop. A server whose probe
+    runs longer than SERVER_PROBE_TIMEOUT_SECONDS, or waits longer than
+    SERVER_PROBE_QUEUE_TIMEOUT_SECONDS for a slot, is left out of the listing
+    and reported as unchecked instead.
+
+    Args:
+        bot: DiscordBot instance
+        user_id: Discord user ID
+
+    Returns:
+        Tuple of (ServerOption objects with indexing information, names of
+        shared servers whose probe timed out)
+    """
+    now = time.monotonic()
+    index_data: Dict[str, Tuple[int, datetime]] = {}
+    server_names: Dict[str, str] = {}
+    to_probe: List[str] = []
+    unchecked_servers: List[str] = []
+
+    # Find servers where both bot and user are members
+    for guild in bot.guilds:
+        if not guild.get_member(user_id):
+            continue
+
+        server_id = str(guild.id)
+        server_names[server_id] = guild.name
+
+        cached = _server_index_cache.get(server_id)
+        if cached is not None and now - cached[0] < SERVER_INDEX_CACHE_TTL_SECONDS:
+            index_data[server_id] = cached[1:]
+        else:
+            to_probe.append(server_id)
+
+    # Check uncached servers for indexed data; finished probes cache their own results
+    results = await asyncio.gather(
+        *(_await_server_probe(server_id) for server_id in to_probe),
+        return_exceptions=True,
+    )
+    for server_id, result in zip(to_probe, results):
+        if isinstance(result, asyncio.TimeoutError):
+            # Slow or hung database - the probe keeps running and caches its result if it
+            # finishes, otherwise the next !ask waits on the same probe again
+            unchecked_servers.append(server_names[server_id])
+            logger.warning(
+                "Timed out checking indexing data for server %s (%s)",
+                server_id,
+                server_names[server_id],
+            )
+            continue
+        if isinstance(result, _SERVER_PROBE_ERRORS):
+            # Log error but continue - this server just won't be available
+            logger.warning(
+                "Error checking indexing data for server %s (%s): %s",
+                server_id,
+                server_names[server_id],
+                result,
+            )
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        index_data[server_id] = result
+
+    mutual_servers = [
+        ServerOption(
+            server_id=server_id,
+            server_name=server_names[server_id],
+            last_indexed=last_indexed,
+            message_count=message_count,
+        )
+        for server_id, (message_count, last_indexed) in index_data.items()
+        # If no messages, skip this server
+        if message_count > 0
+    ]
+
+    # Sort by message count (most active servers first)
+    mutual_servers.sort(key=lambda x: x.message_count, reverse=True)
+
+    return mutual_servers, unchecked_servers
+
+
+def _pack_message_parts(
+    parts: List[str], limit: int = DISCORD_MESSAGE_MAX_LENGTH
+) -> List[str]:
+    """Join message parts into as few messages as possible, each within limit.
+
+    Parts are never split unless a single part is longer than limit on its own,
+    in which case it is cut into limit-sized pieces.
+
+    Args:
+        parts: Message fragments in send order
+        limit: Maximum length of each resulting message
+
+    Returns:
+        List of message strings ready to send
+    """
+    messages: List[str] = []
+    current: List[str] = []
+    current_length = 0
+
+    for part in parts:
+        if current_length + len(part) > limit and current:
+            messages.append("".join(current))
+            current = []
+            current_length = 0
+        while len(part) > limit:
+            messages.append(part[:limit])
+            part = part[limit:]
+        current.append(part)
+        current_length += len(part)
+
+    if current:
+        messages.append("".join(current))
+    return messages
 
 
 async def handle_dm_message(bot: "DiscordBot", message: discord.Message) -> None:
@@ -140,26 +678,17 @@ async def handle_dm_message(bot: "DiscordBot", message: discord.Message) -> None
         bot: DiscordBot instance
         message: Discord DM message object
     """
-    logger = logging.getLogger(__name__)
-
-    content_preview = (
-        message.content[:30] + "..." if len(message.content) > 30 else message.content
-    )
-    logger.info(
-        f"💬 Received non-command DM from {message.author.name}: {content_preview}"
-    )
+    # Only build the preview when INFO records are actually emitted (%.30s truncates lazily)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "💬 Received non-command DM from %s: %.30s%s",
+            message.author.name,
+            message.content,
+            "..." if len(message.content) > 30 else "",
+        )
 
     # Provide helpful guidance for stateless interaction model
-    await message.channel.send(
-        "👋 Hello! I'm the Discord Indexer Bot.\n\n"
-        "To ask me a question, use:\n"
-        "• `!ask <your question>` - Ask me anything about your servers\n"
-        "• `!help` - Show all available commands\n"
-        "• `!status` - Show bot status\n\n"
-        "Each `!ask` command is processed independently in a fair queue.\n"
-        "Your conversation history is preserved in the database for context.\n\n"
-        "Note: Only server messages are indexed. DMs are private and never stored."
-    )
+    await bot.channel_send_limiter.send(message.channel, _DM_GUIDANCE_REPLY)
 
 
 async def on_message_handler(bot: "DiscordBot", message: discord.Message) -> None:
@@ -174,113 +703,75 @@ async def on_message_handler(bot: "DiscordBot", message: discord.Message) -> Non
         bot: DiscordBot instance with message processing pipeline
         message: Discord message object to process
     """
-    logger = logging.getLogger(__name__)
-
-    # Skip messages from the bot itself
-    if message.author == bot.user:
+    # Bind hot attributes once; they are read several times below
+    author = message.author
+    content = message.content
+    guild = message.guild
+
+    # Skip only the bot's own messages - other bots and webhooks are indexed, exactly as
+    # historical and resume processing index them. An int compare avoids User.__eq__.
+    if author.id == bot.user.id:
         return
 
-    # Handle DM messages
-    if isinstance(message.channel, discord.DMChannel):
-        # Check if this is a command - if so, let the commands extension handle it
-        if message.content.startswith(bot.command_prefix):
-            # Command will be processed by bot.process_commands() after this handler
-            return
-        else:
-            # Handle non-command DMs - provide helpful guidance
-            try:
-                await handle_dm_message(bot, message)
-            except (discord.HTTPException, discord.Forbidden, discord.NotFound) as e:
-                logger.error(
-                    f"Discord error handling DM from {message.author.name}: {e}"
-                )
-            except (asyncio.TimeoutError, ConnectionError) as e:
-                logger.error(
-                    f"Connection error handling DM from {message.author.name}: {e}"
-                )
+    # Skip commands in both DMs and servers - the default Bot.on_message runs
+    # process_commands() for them. command_prefix is a plain str, so this is a single compare.
+    if content.startswith(bot.command_prefix):
         return
 
-    # Handle server/guild messages for indexing
-    if not message.guild:
-        logger.warning("Received non-DM message without guild - skipping")
+    # Handle non-command DMs - provide helpful guidance (a bot only sees guild-less messages in DMs)
+    if guild is None:
+        try:
+            await handle_dm_message(bot, message)
+        except (discord.HTTPException, discord.Forbidden, discord.NotFound) as e:
+            logger.error("Discord error handling DM from %s: %s", author.name, e)
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.error("Connection error handling DM from %s: %s", author.name, e)
         return
 
-    # Skip server commands - they get processed by the commands extension
-    if message.content.startswith(bot.command_prefix):
-        # Command will be processed by bot.process_commands() after this handler
+    # Server/guild messages from here on. Unconfigured servers are rejected first with one
+    # set lookup, so their messages skip every other check (should already be configured at startup)
+    server_id = str(guild.id)
+    if not is_server_configured(server_id):
+        logger.debug("Skipping message indexing for unconfigured server %s (%s)", guild.name, server_id)
         return
 
     # Skip system messages
     if message.type != discord.MessageType.default:
         return
-        
-    # Skip empty messages (unless they have attachments)
-    if not message.content.strip() and not message.attachments:
+
+    # Skip empty or trivially short messages (unless they have attachments to describe).
+    # The pipeline applies the same threshold to historical messages, so both paths agree.
+    if len(content.strip()) < MIN_INDEXABLE_CONTENT_LENGTH and not message.attachments:
         return
 
-    # Check if server is configured (should already be configured at startup)
-    server_id = str(message.guild.id)
+    # Same nested structure as historical processing. Extraction only copies attributes that
+    # discord.py has already parsed (tens of microseconds), so it stays on the event loop;
+    # asyncio.to_thread would only pay off once it does real CPU work such as parsing content.
+    message_data = bot._extract_message_data(message)
 
-    if not is_server_configured(server_id):
-        logger.warning(f"Skipping message indexing for unconfigured server {message.guild.name} ({server_id})")
-        return
+    # Only build the preview when INFO records are actually emitted (%.30s truncates lazily)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "📨 Processing server message: #%s - %s: %.30s%s",
+            message.channel.name,
+            author.name,
+            content,
+            "..." if len(content) > 30 else "",
+        )
 
-    # Convert Discord message to processing format (using nested structure to match historical processing)
-    message_data = {
-        "id": message.id,
-        "content": message.content,
-        "author": {
-            "id": message.author.id,
-            "name": message.author.name,
-            "display_name": message.author.display_name,
-            "global_name": getattr(message.author, 'global_name', None),
-            "nick": getattr(message.author, 'nick', None),
-            "discriminator": getattr(message.author, 'discriminator', None),
-            "bot": message.author.bot,
-            "system": getattr(message.author, 'system', False)
-        },
-        "channel": {
-            "id": message.channel.id,
-            "name": message.channel.name,
-            "type": str(message.channel.type),
-            "category_id": getattr(message.channel, 'category_id', None),
-            "position": getattr(message.channel, 'position', None)
-        },
-        "guild": {
-            "id": message.guild.id,
-            "name": message.guild.name,
-            "icon": str(message.guild.icon) if message.guild.icon else None,
-            "member_count": getattr(message.guild, 'member_count', None),
-            "features": getattr(message.guild, 'features', [])
-        } if message.guild else {"id": None, "name": None},
-        "timestamp": message.created_at.isoformat(),
-        "edited_at": message.edited_at.isoformat() if message.edited_at else None,
-        "pinned": message.pinned,
-        "reference": {"message_id": message.reference.message_id} if message.reference else None,
-        "attachments": [att.url for att in message.attachments],
-        "has_embeds": len(message.embeds) > 0,
-        "type": str(message.type),
-    }
-
-    content_preview = (
-        message.content[:30] + "..." if len(message.content) > 30 else message.content
-    )
-    logger.info(
-        f"📨 Processing server message: #{message.channel.name} - {message.author.name}: {content_preview}"
-    )
+    # Shed load early instead of stalling the gateway once the pipeline falls behind
+    queue = bot.realtime_queue
+    if random.random() < _early_drop_probability(queue.qsize(), queue.maxsize):
+        logger.warning(
+            "Real-time queue under pressure (%d/%d) - dropping message %s",
+            queue.qsize(),
+            queue.maxsize,
+            message.id,
+        )
+        return
 
-    try:
-        # Use existing batch processing infrastructure with single-item batch
-        success = await bot.send_batch_to_pipeline([message_data])
-        
-        if success:
-            logger.info(f"Successfully processed message from {message.author.display_name}")
-        else:
-            logger.warning(f"Message processing failed for message {message.id}")
-        
-    except Exception as e:
-        logger.error(f"Failed to process message {message.id}: {e}")
-        # Don't crash the bot on processing errors
+    # Hand off to the batch flusher (never full here: drop probability is 1 at capacity)
+    queue.put_nowait(message_data)
 
 
 def setup_bot_actions(bot: "DiscordBot") -> None:
@@ -292,13 +783,12 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
     Args:
         bot: DiscordBot instance to register handlers with
     """
-    logger = logging.getLogger(__name__)
-
     # ===== EVENT HANDLERS =====
-    @bot.event
-    async def on_ready() -> None:
-        """Event when bot connects to Discord."""
-        await on_ready_handler(bot)
+    # Hot handlers are registered as listeners bound to the bot with functools.partial,
+    # so each dispatch calls the module-level handler directly instead of through a wrapper.
+    # Commands are still dispatched by the default Bot.on_message (process_commands).
+    bot.add_listener(functools.partial(on_ready_handler, bot), "on_ready")
+    bot.add_listener(functools.partial(on_message_handler, bot), "on_message")
 
     @bot.event
     async def on_connect() -> None:
@@ -316,130 +806,131 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
         logger.info("Discord bot session resumed")
 
     @bot.event
-    async def on_message(message: discord.Message) -> None:
-        """Event when new message is received."""
-        await on_message_handler(bot, message)
-        # Process commands after handling the message
-        await bot.process_commands(message)
-
-    # ===== HELPER FUNCTIONS =====
-
-    async def _get_mutual_servers_with_data(
-        bot: "DiscordBot", user_id: int
-    ) -> List[ServerOption]:
-        """Get servers shared between bot and user, with indexing data.
+    async def on_guild_join(guild: discord.Guild) -> None:
+        """Event when bot joins a guild."""
+        bot.refresh_channel_counts()
 
-        Args:
-            bot: DiscordBot instance
-            user_id: Discord user ID
-
-        Returns:
-            List of ServerOption objects with indexing information
-        """
-        from datetime import datetime
-
-        mutual_servers = []
-
-        # Find servers where both bot and user are members
-        for guild in bot.guilds:
-            member = guild.get_member(user_id)
-            if member:  # User is in this server
-                server_id = str(guild.id)
-                server_name = guild.name
-
-                # Check if this server has indexed data
-                try:
-                    # Check if database directory exists
-                    db_path = os.path.join(
-                        "src", "db", "databases", server_id, "chroma_data"
-                    )
+    @bot.event
+    async def on_guild_remove(guild: discord.Guild) -> None:
+        """Event when bot leaves or is removed from a guild."""
+        bot.refresh_channel_counts()
 
-                    if os.path.exists(db_path):
-                        # Get ChromaDB client and check message count
-                        client = get_db(int(server_id))
-                        collection = client.get_or_create_collection(
-                            name="messages", metadata={"server_id": server_id}
-                        )
-
-                        message_count = collection.count()
-
-                        # If no messages, skip this server
-                        if message_count == 0:
-                            continue
-
-                        # Try to determine last indexed date
-                        # This is a simple approach - could be enhanced
-                        last_indexed = datetime.now()  # Default to now
-                        if os.path.exists(db_path):
-                            # Use directory modification time as proxy
-                            last_indexed = datetime.fromtimestamp(
-                                os.path.getmtime(db_path)
-                            )
-
-                        mutual_servers.append(
-                            ServerOption(
-                                server_id=server_id,
-                                server_name=server_name,
-                                last_indexed=last_indexed,
-                                message_count=message_count,
-                            )
-                        )
-
-                except (
-                    OSError,
-                    FileNotFoundError,
-                    PermissionError,
-                    ValueError,
-                    ImportError,
-                    AttributeError,
-                    KeyError,
-                    TypeError,
-                ) as e:
-                    # Log error but continue - this server just won't be available
-                    logger.warning(
-                        f"Error checking indexing data for server {server_id} ({server_name}): {e}"
-                    )
-                    continue
+    @bot.event
+    async def on_guild_channel_create(channel: discord.abc.GuildChannel) -> None:
+        """Event when a channel is created in a guild."""
+        if isinstance(channel, discord.TextChannel):
+            bot.text_channel_count += 1
 
-        # Sort by message count (most active servers first)
-        mutual_servers.sort(key=lambda x: x.message_count, reverse=True)
+    @bot.event
+    async def on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
+        """Event when a channel is deleted from a guild."""
+        if isinstance(channel, discord.TextChannel):
+            bot.text_channel_count -= 1
 
-        return mutual_servers
+    @bot.event
+    async def on_guild_channel_update(
+        before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        """Event when a channel is updated - recount only if its type changed."""
+        if type(before) is not type(after):
+            bot.refresh_channel_counts()
+
+    # Process-wide singletons shared with the queue worker; resolved once for all commands
+    conversation_queue = get_conversation_queue()
+    conversation_db = get_conversation_db()
+    # Users whose !ask is still resolving servers, before it reaches the queue
+    inflight_ask_users: Set[str] = set()
+
+    # ===== STATIC EMBEDS =====
+    # Built once at setup; only !status needs a fresh embed per invocation
+    help_embed = discord.Embed(
+        title="🤖 Discord Indexer Bot",
+        description="I index messages from server channels to enable AI-powered search and conversation.",
+        color=discord.Color.blue(),
+    )
+    help_embed.add_field(
+        name="📋 Available Commands",
+        value=(
+            "`!help` - Show this help message\n"
+            "`!status` - Show bot status and statistics\n"
+            "`!info` - Show detailed bot information"
+        ),
+        inline=False,
+    )
+    help_embed.add_field(
+        name="🤖 DMAssistant Commands (DM Only)",
+        value=(
+            "`!ask <question>` - Ask me anything about your servers\n"
+            "`!clear-conversation-history` - Delete your conversation history"
+        ),
+        inline=False,
+    )
+    help_embed.add_field(
+        name="💬 How Questions Work",
+        value=(
+            "• Each `!ask` command is processed independently\n"
+            "• Fair queue system - everyone gets equal access\n"
+            "• Conversation history preserved for context\n"
+            "• Multiple servers: use `!ask [ServerName] question`\n"
+            "• I can search and reference server message history"
+        ),
+        inline=False,
+    )
+    help_embed.add_field(
+        name="🔒 Privacy Notice",
+        value="Only server messages are indexed. DMs are private and never stored.",
+        inline=False,
+    )
+    help_embed.set_footer(text="Start a conversation in DMs or use commands anywhere")
 
+    info_embed = discord.Embed(
+        title="ℹ️ About Discord Indexer Bot",
+        description="Advanced Discord message indexing system for AI-powered search and analysis.",
+        color=discord.Color.purple(),
+    )
+    info_embed.add_field(
+        name="🎯 Purpose",
+        value="Build searchable indexes of Discord server messages",
+        inline=False,
+    )
+    info_embed.add_field(
+        name="🔄 Message Flow",
+        value=(
+            "• **Server messages** → Indexed and searchable\n"
+            "• **DM messages** → Private, never indexed\n"
+            "• **Commands** → Processed instantly"
+        ),
+        inline=False,
+    )
+    info_embed.add_field(
+        name="🧠 Technology",
+        value="Powered by advanced NLP and vector embeddings",
+        inline=False,
+    )
+    info_embed.set_footer(text="Developed for intelligent Discord data analysis")
 
     # ===== COMMAND HANDLERS =====
-    @bot.command(name="ask")
-    async def ask_command(ctx: commands.Context, *, message: str = None) -> None:
-        """Ask the DMAssistant a question (stateless queue-based processing)."""
-        if not message:
-            await ctx.send(
-                "❓ **Usage**: `!ask <your question>`\nExample: `!ask What did PM say about the standup?`"
-            )
-            return
+    @bot.before_invoke
+    async def throttle_command_reply(ctx: commands.Context) -> None:
+        """Take a per-channel send token before a command replies."""
+        await bot.channel_send_limiter.acquire(ctx.channel.id)
 
-        # Only work in DMs
-        if not isinstance(ctx.channel, discord.DMChannel):
-            await ctx.send(
-                "🔒 **DM Only**: The `!ask` command only works in direct messages for privacy."
-            )
-            return
-
-        # Import systems
-
-        queue = get_conversation_queue()
-        user_id = str(ctx.author.id)
+    async def _route_ask_request(
+        ctx: commands.Context, user_id: str, message: str
+    ) -> None:
+        """Resolve the target server for an !ask and queue it or ask the user to choose.
 
-        # Check if user already has a request queued
-        if queue.is_user_queued(user_id):
-            await ctx.send(
-                "⏳ **Already Processing**: You already have a request in the queue. Please wait for it to complete."
-            )
-            return
+        Args:
+            ctx: Command context of the !ask invocation
+            user_id: Discord user ID as a string
+            message: Raw !ask argument, optionally prefixed with [server]
+        """
+        queue = conversation_queue
 
         # Parse server selection from message if present [server] format
         server_selection = None
         actual_message = message
-        server_match = re.match(r"^\[([^\]]+)\]\s*(.*)", message)
+        server_match = _SERVER_SELECTION_RE.match(message)
         if server_match:
             server_selection = server_match.group(1).strip()
             actual_message = server_match.group(2).strip()
@@ -451,17 +942,22 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
                 return
 
         # Find mutual servers that are both indexed AND configured
-        mutual_servers = await _get_mutual_servers_with_data(bot, ctx.author.id)
-
-        # Filter to only include configured servers
+        mutual_servers, unchecked_servers = await _get_mutual_servers_with_data(
+            bot, ctx.author.id
+        )
 
-        configured_servers = []
-        for server in mutual_servers:
-            if is_server_configured(server.server_id):
-                configured_servers.append(server)
+        # Filter to only include configured servers (one bulk cache lookup)
+        configured_ids = filter_configured_servers(
+            server.server_id for server in mutual_servers
+        )
+        configured_servers = [
+            server for server in mutual_servers if server.server_id in configured_ids
+        ]
 
         if not configured_servers:
-            if mutual_servers:
+            if unchecked_servers:
+                await ctx.send(_SERVERS_UNCHECKED_REPLY)
+            elif mutual_servers:
                 await ctx.send(
                     "❌ **No Configured Servers**: The servers we share have messages but haven't been configured yet. Please ask the server admin to run the bot setup."
                 )
@@ -480,26 +976,41 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
             # Try to find by number first
             try:
                 server_num = int(server_selection)
+            except ValueError:
+                server_num = None
+
+            if server_num is not None:
+                # Numbers refer to a complete listing; with unchecked servers left out the
+                # remaining ones shift, so [2] could silently mean a different server
+                if unchecked_servers:
+                    await ctx.send(_SERVERS_UNCHECKED_REPLY)
+                    return
                 if 1 <= server_num <= len(mutual_servers):
                     selected_server = mutual_servers[server_num - 1]
-            except ValueError:
-                # Try to find by name
+            else:
+                # Try to find by name (case-insensitive; first server wins on duplicate names)
+                wanted_name = server_selection.lower()
                 for server in mutual_servers:
-                    if server.server_name.lower() == server_selection.lower():
+                    if server.server_name.lower() == wanted_name:
                         selected_server = server
                         break
 
             if not selected_server:
+                # The requested server may be one whose probe timed out
+                if unchecked_servers:
+                    await ctx.send(_SERVERS_UNCHECKED_REPLY)
+                    return
                 await ctx.send(
                     f"❌ **Invalid Server**: '{server_selection}' not found. Use `!ask` without server selection to see available options."
                 )
                 return
 
-        # If only one server or server specified, go directly to queue
-        if len(mutual_servers) == 1 or selected_server:
+        # If only one server or server specified, go directly to queue (never pick the
+        # only checked server by default while others are still unchecked)
+        if (len(mutual_servers) == 1 and not unchecked_servers) or selected_server:
             server = selected_server or mutual_servers[0]
 
-            success = await queue.add_request(
+            request = await queue.add_request(
                 user_id=user_id,
                 server_id=server.server_id,
                 message=actual_message,
@@ -507,7 +1018,7 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
                 discord_channel=ctx.channel,
             )
 
-            if success:
+            if request is not None:
                 position = queue.get_queue_position(user_id)
                 server_name = server.server_name
                 if position == 1:
@@ -520,8 +1031,7 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
                     )
 
                 # Store status message ID for updates
-                if user_id in queue._active_requests:
-                    queue._active_requests[user_id].status_message_id = status_msg.id
+                request.status_message_id = status_msg.id
             else:
                 await ctx.send(
                     "❌ **Queue Full**: Too many requests right now. Please try again in a few minutes."
@@ -529,7 +1039,9 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
             return
 
         # Multiple servers - send selection message with instructions
-        selection_text = "🔍 **Server Selection**: I found your question, but we're in multiple servers. Which server should I search?\n\n"
+        parts = [
+            "🔍 **Server Selection**: I found your question, but we're in multiple servers. Which server should I search?\n\n"
+        ]
 
         for i, server in enumerate(mutual_servers, 1):
             last_indexed = (
@@ -537,16 +1049,63 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
                 if server.last_indexed
                 else "Never"
             )
-            selection_text += f"**{i}. {server.server_name}**\n"
-            selection_text += f"   📊 {server.message_count:,} messages | 📅 Last indexed: {last_indexed}\n\n"
+            # A partial listing is not numbered: numbers are only accepted for complete ones
+            label = f"• {server.server_name}" if unchecked_servers else f"{i}. {server.server_name}"
+            parts.append(
+                f"**{label}**\n"
+                f"   📊 {server.message_count:,} messages | 📅 Last indexed: {last_indexed}\n\n"
+            )
+
+        if unchecked_servers:
+            parts.append(
+                f"⏳ {len(unchecked_servers)} other shared server(s) couldn't be checked in time "
+                "and are not listed. Try again in a moment to see them.\n\n"
+            )
 
-        selection_text += "**To proceed**, use `!ask` again but specify the server:\n"
-        selection_text += (
+        parts.append("**To proceed**, use `!ask` again but specify the server:\n")
+        parts.append(
             f"Example: `!ask [{mutual_servers[0].server_name}] {actual_message}`\n\n"
         )
-        selection_text += "Or use server number: `!ask [1] {actual_message}`"
+        if not unchecked_servers:
+            parts.append(f"Or use server number: `!ask [1] {actual_message}`")
 
-        await ctx.send(selection_text)
+        # Many shared servers or long names can exceed Discord's message limit
+        first, *rest = _pack_message_parts(parts)
+        await ctx.send(first)
+        for text in rest:
+            await bot.channel_send_limiter.send(ctx.channel, text)
+
+    @bot.command(name="ask")
+    async def ask_command(ctx: commands.Context, *, message: str = None) -> None:
+        """Ask the DMAssistant a question (stateless queue-based processing)."""
+        if not message:
+            await ctx.send(
+                "❓ **Usage**: `!ask <your question>`\nExample: `!ask What did PM say about the standup?`"
+            )
+            return
+
+        # Only work in DMs
+        if not isinstance(ctx.channel, discord.DMChannel):
+            await ctx.send(
+                "🔒 **DM Only**: The `!ask` command only works in direct messages for privacy."
+            )
+            return
+
+        user_id = str(ctx.author.id)
+
+        # Check if user already has a request queued, or a duplicate !ask (e.g. a client
+        # double-send) is still resolving servers - single-flight per user
+        if user_id in inflight_ask_users or conversation_queue.is_user_queued(user_id):
+            await ctx.send(
+                "⏳ **Already Processing**: You already have a request in the queue. Please wait for it to complete."
+            )
+            return
+
+        inflight_ask_users.add(user_id)
+        try:
+            await _route_ask_request(ctx, user_id, message)
+        finally:
+            inflight_ask_users.discard(user_id)
 
     @bot.command(name="clear-conversation-history")
     async def clear_history_command(ctx: commands.Context) -> None:
@@ -558,12 +1117,11 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
             )
             return
 
-        conv_db = get_conversation_db()
         user_id = str(ctx.author.id)
         server_id = "0"  # DM context
 
         # Clear conversation history
-        success = conv_db.clear_user_conversation_history(user_id, server_id)
+        success = conversation_db.clear_user_conversation_history(user_id, server_id)
 
         if success:
             await ctx.send(
@@ -577,59 +1135,17 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
     @bot.command(name="help")
     async def help_command(ctx: commands.Context) -> None:
         """Show available bot commands and information."""
-        embed = discord.Embed(
-            title="🤖 Discord Indexer Bot",
-            description="I index messages from server channels to enable AI-powered search and conversation.",
-            color=discord.Color.blue(),
-        )
-        embed.add_field(
-            name="📋 Available Commands",
-            value=(
-                "`!help` - Show this help message\n"
-                "`!status` - Show bot status and statistics\n"
-                "`!info` - Show detailed bot information"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="🤖 DMAssistant Commands (DM Only)",
-            value=(
-                "`!ask <question>` - Ask me anything about your servers\n"
-                "`!clear-conversation-history` - Delete your conversation history"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="💬 How Questions Work",
-            value=(
-                "• Each `!ask` command is processed independently\n"
-                "• Fair queue system - everyone gets equal access\n"
-                "• Conversation history preserved for context\n"
-                "• Multiple servers: use `!ask [ServerName] question`\n"
-                "• I can search and reference server message history"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="🔒 Privacy Notice",
-            value="Only server messages are indexed. DMs are private and never stored.",
-            inline=False,
-        )
-        embed.set_footer(text="Start a conversation in DMs or use commands anywhere")
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=help_embed)
 
     @bot.command(name="status")
     async def status_command(ctx: commands.Context) -> None:
         """Show current bot status and statistics."""
-        guild_count = len(bot.guilds)
-        channel_count = len(bot.get_all_channels())
+        guild_count = bot.guild_count
+        channel_count = bot.text_channel_count
         pipeline_status = "✅ Active" if bot.message_pipeline else "❌ Inactive"
 
         # Get queue statistics
-
-        queue = get_conversation_queue()
-        queue_stats = queue.get_stats()
+        queue_stats = conversation_queue.get_stats()
 
         embed = discord.Embed(title="📊 Bot Status", color=discord.Color.green())
 
@@ -671,63 +1187,33 @@ def setup_bot_actions(bot: "DiscordBot") -> None:
     @bot.command(name="info")
     async def info_command(ctx: commands.Context) -> None:
         """Show detailed information about the bot."""
-        embed = discord.Embed(
-            title="ℹ️ About Discord Indexer Bot",
-            description="Advanced Discord message indexing system for AI-powered search and analysis.",
-            color=discord.Color.purple(),
-        )
-        embed.add_field(
-            name="🎯 Purpose",
-            value="Build searchable indexes of Discord server messages",
-            inline=False,
-        )
-        embed.add_field(
-            name="🔄 Message Flow",
-            value=(
-                "• **Server messages** → Indexed and searchable\n"
-                "• **DM messages** → Private, never indexed\n"
-                "• **Commands** → Processed instantly"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="🧠 Technology",
-            value="Powered by advanced NLP and vector embeddings",
-            inline=False,
-        )
-        embed.set_footer(text="Developed for intelligent Discord data analysis")
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=info_embed)
 
     # ===== COMMAND ERROR HANDLING =====
     @bot.event
     async def on_command_error(
         ctx: commands.Context, error: commands.CommandError
     ) -> None:
-        """Handle command errors gracefully."""
-        if isinstance(error, commands.CommandNotFound):
-            await ctx.send(
-                f"❓ **Command not found!**\nUse `!help` to see available commands."
-            )
-        elif isinstance(error, commands.MissingRequiredArgument):
-            await ctx.send(
-                f"❌ **Missing required argument!**\n"
-                f"Use `!help` for command usage information."
-            )
-        elif isinstance(error, commands.BadArgument):
-            await ctx.send(
-                f"❌ **Invalid argument!**\nUse `!help` for command usage information."
-            )
-        elif isinstance(error, commands.CommandOnCooldown):
-            await ctx.send(
-                f"⏰ **Command on cooldown!**\n"
-                f"Try again in {error.retry_after:.1f} seconds."
-            )
-        else:
-            logger.error(f"Unexpected command error: {error}")
-            await ctx.send(
-                "❌ **An unexpected error occurred!**\n"
-                "The error has been logged for investigation."
+        """Handle command errors gracefully.
+
+        Replies go through the channel send limiter: before_invoke never ran for
+        most of these errors, and when it did its token paid for the command's
+        own reply.
+        """
+        if isinstance(error, commands.CommandOnCooldown):
+            await bot.channel_send_limiter.send(
+                ctx.channel, _COMMAND_ON_COOLDOWN_REPLY.format(retry_after=error.retry_after)
             )
+            return
+
+        # Walk the MRO so subclasses (e.g. MemberNotFound -> BadArgument) keep their reply
+        for error_type in type(error).__mro__:
+            reply = _COMMAND_ERROR_REPLIES.get(error_type)
+            if reply is not None:
+                await bot.channel_send_limiter.send(ctx.channel, reply)
+                return
+
+        logger.error("Unexpected command error: %s", error)
+        await bot.channel_send_limiter.send(ctx.channel, _UNEXPECTED_ERROR_REPLY)
 
     logger.info("✅ Bot event handlers and commands registered")
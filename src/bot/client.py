@@ -1,16 +1,18 @@
 import asyncio
+from collections import deque
 import discord
 from discord.ext import commands
 from src.config.settings import settings
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
-from src.bot.rate_limiter import DiscordRateLimiter
+from typing import Deque, List, Dict, Any, Optional, Set, TYPE_CHECKING
+from src.bot.rate_limiter import DiscordRateLimiter, ChannelSendLimiter
 from src.message_processing.storage import get_server_indexing_status
 from src.setup import is_server_configured
 
 if TYPE_CHECKING:
     from src.message_processing import MessagePipeline
     from src.ai.agents.dm_assistant import DMAssistant
+    from src.ai.agents.queue_worker import ConversationQueueWorker
 
 
 class DiscordBot(commands.Bot):
@@ -26,31 +28,56 @@ class DiscordBot(commands.Bot):
             command_prefix=settings.COMMAND_PREFIX,
             intents=settings.get_intents,
             help_command=None,
+            max_messages=None,  # No edit/delete/reaction handlers, so skip the message cache
         )
         # Pipeline coordination
         self.pipeline_ready = asyncio.Event()
         self.pipeline_ready.set()  # Initially ready
-        self.message_pipeline: Optional["MessagePipeline"] = None
-        self.batch_size = 1000
+        self.message_pipeline: Optional["MessagePipeline"] = None  # None until on_ready_handler
+        self.batch_size: int = 1000
+
+        # Real-time messages are buffered here and submitted in small batches
+        self.realtime_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=1024)
+        self.realtime_flusher_task: Optional[asyncio.Task] = None
+
+        # Strong references to fire-and-forget tasks (the event loop only keeps weak ones)
+        self.background_tasks: Set[asyncio.Task] = set()
+
+        # Set by event handlers on unrecoverable errors; main() waits on it and shuts down
+        self.shutdown_event = asyncio.Event()
+        self.shutdown_reason: Optional[str] = None
         
-        # DMAssistant for conversation handling
+        # DMAssistant for conversation handling (None until on_ready_handler initializes them)
         self.dm_assistant: Optional["DMAssistant"] = None
-        self.queue_worker = None
+        self.queue_worker: Optional["ConversationQueueWorker"] = None
+        
+        # Cached counts for status reporting, kept current by guild/channel events
+        self.guild_count: int = 0
+        self.text_channel_count: int = 0
         
         # Legacy storage (will be removed when pipeline fully implemented)
-        self.stored_messages: List[Dict[str, Any]] = []
-        self.processed_channels: List[int] = []
+        self.stored_messages: Deque[Dict[str, Any]] = deque(maxlen=10_000)  # bounded
+        self.processed_channels: Set[int] = set()  # reconnects re-process the same channels
         
         # Rate limiting and logging
         self.rate_limiter = DiscordRateLimiter()
+        self.channel_send_limiter = ChannelSendLimiter()
         self.logger = logging.getLogger(__name__)
 
     async def close(self) -> None:
         """Clean shutdown of bot connection."""
         self.logger.info("Starting bot shutdown sequence...")
+
+        # Stop background tasks (including the real-time batch flusher) before the pipeline goes away
+        if self.background_tasks:
+            self.logger.info(f"Cancelling {len(self.background_tasks)} background task(s)...")
+            for task in list(self.background_tasks):
+                task.cancel()
+            self.background_tasks.clear()
+        self.realtime_flusher_task = None
         
         # Clear queue worker FIRST to prevent it from trying to use Discord connections
-        if hasattr(self, 'queue_worker') and self.queue_worker:
+        if self.queue_worker is not None:
             self.logger.info("Stopping queue worker...")
             try:
                 await self.queue_worker.stop()
@@ -63,12 +90,12 @@ class DiscordBot(commands.Bot):
                 self.queue_worker = None
         
         # Clear message pipeline reference
-        if self.message_pipeline:
+        if self.message_pipeline is not None:
             self.message_pipeline = None
             self.logger.info("Message pipeline cleared")
             
         # Clear DMAssistant reference
-        if hasattr(self, 'dm_assistant') and self.dm_assistant:
+        if self.dm_assistant is not None:
             self.dm_assistant = None
             self.logger.info("DMAssistant cleared")
 
@@ -81,19 +108,6 @@ class DiscordBot(commands.Bot):
         """Called when bot is starting up."""
         self.logger.info("Bot setup hook called - preparing to connect...")
 
-    async def on_ready(self) -> None:
-        """Event when bot connects to Discord."""
-        self.logger.info(f"{self.user} has connected to Discord!")
-        self.logger.info(f"Bot is in {len(self.guilds)} guild(s)")
-
-        # Log available guilds and channels
-        for guild in self.guilds:
-            self.logger.info(
-                f"Connected to guild: {guild.name} (ID: {guild.id})"
-            )
-            self.logger.debug(f"  - Text channels: {len(guild.text_channels)}")
-            self.logger.debug(f"  - Total channels: {len(guild.channels)}")
-
     def get_all_channels(self) -> List[discord.TextChannel]:
         """Get all text channels the bot can access.
 
@@ -108,6 +122,21 @@ class DiscordBot(commands.Bot):
             if isinstance(channel, discord.TextChannel)
         ]
     
+    def refresh_channel_counts(self) -> None:
+        """Recount guilds and accessible text channels into the cached counters.
+
+        Called on ready and when guilds join or leave; individual channel
+        create/delete events adjust text_channel_count incrementally.
+        """
+        guilds = self.guilds
+        self.guild_count = len(guilds)
+        self.text_channel_count = sum(
+            1
+            for guild in guilds
+            for channel in guild.channels
+            if isinstance(channel, discord.TextChannel)
+        )
+
     def get_channels_by_guild(self) -> Dict[int, List[discord.TextChannel]]:
         """Get text channels grouped by guild ID.
 
@@ -183,7 +212,7 @@ class DiscordBot(commands.Bot):
         Returns:
             True if batch processed successfully, False if failed
         """
-        if not self.message_pipeline:
+        if self.message_pipeline is None:
             self.logger.error("Message pipeline not available")
             return False
             
@@ -219,7 +248,7 @@ class DiscordBot(commands.Bot):
         Returns:
             True if all servers processed successfully, False if failed
         """
-        if not self.message_pipeline:
+        if self.message_pipeline is None:
             self.logger.error("Message pipeline not available for resumption processing")
             return False
             
@@ -285,7 +314,7 @@ class DiscordBot(commands.Bot):
                         
                         # Update processed channels list
                         for channel in channel_batch:
-                            self.processed_channels.append(channel.id)
+                            self.processed_channels.add(channel.id)
                 
                 elif server_status['resumption_recommended']:
                     # Server can resume from last timestamp
@@ -321,14 +350,14 @@ class DiscordBot(commands.Bot):
                         
                         # Update processed channels list
                         for channel in channel_batch:
-                            self.processed_channels.append(channel.id)
+                            self.processed_channels.add(channel.id)
                 
                 else:
                     # Server is fully up to date
                     self.logger.info(f"Server {guild_id}: Already up to date, skipping")
                     # Still mark channels as processed for tracking
                     for channel in guild_channels:
-                        self.processed_channels.append(channel.id)
+                        self.processed_channels.add(channel.id)
                 
                 overall_total_processed += server_total_processed
                 self.logger.info(f"Server {guild_id} resumption completed. Processed {server_total_processed} new messages")
@@ -1,7 +1,7 @@
 import asyncio
 import time
 import logging
-from typing import Optional, List, Dict, Any, Callable, Awaitable
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple
 from dataclasses import dataclass
 from collections import deque
 from datetime import datetime
@@ -279,4 +279,83 @@ class DiscordRateLimiter:
         return all_messages
 
 
+class ChannelSendLimiter:
+    """
+    Client-side token bucket per channel for outgoing bot messages.
+
+    Discord allows about 5 messages per 5 seconds in a single channel. Waiting
+    for a token locally spaces out bursts (for example a user spamming commands)
+    instead of letting them hit 429 responses and discord.py's retry backoff.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 5,
+        refill_per_second: float = 1.0,
+        max_tracked_channels: int = 1024,
+    ):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_tracked_channels = max_tracked_channels
+
+        # channel_id -> (available tokens, monotonic time of last update)
+        self._buckets: Dict[int, Tuple[float, float]] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+        # Logging
+        self.logger = logging.getLogger(__name__)
+
+    async def acquire(self, channel_id: int) -> None:
+        """
+        Take one send token for a channel, waiting for a refill if none is left.
 
+        Args:
+            channel_id: Discord channel ID the message will be sent to
+        """
+        if len(self._locks) >= self.max_tracked_channels:
+            self._prune_idle_channels()
+
+        lock = self._locks.setdefault(channel_id, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(channel_id, (float(self.capacity), now))
+            tokens = min(float(self.capacity), tokens + (now - updated) * self.refill_per_second)
+
+            if tokens < 1.0:
+                wait_time = (1.0 - tokens) / self.refill_per_second
+                self.logger.debug(
+                    f"Channel {channel_id} send limit reached, waiting {wait_time:.2f}s"
+                )
+                await asyncio.sleep(wait_time)
+                now = time.monotonic()
+                tokens = 1.0
+
+            self._buckets[channel_id] = (tokens - 1.0, now)
+
+    async def send(
+        self, channel: discord.abc.Messageable, *args: Any, **kwargs: Any
+    ) -> discord.Message:
+        """
+        Send a message to a channel once a token for that channel is available.
+
+        Args:
+            channel: Channel to send to (must expose an ``id``)
+            *args: Positional arguments forwarded to ``channel.send``
+            **kwargs: Keyword arguments forwarded to ``channel.send``
+
+        Returns:
+            The sent Discord message
+        """
+        await self.acquire(channel.id)
+        return await channel.send(*args, **kwargs)
+
+    def _prune_idle_channels(self) -> None:
+        """Forget channels whose bucket has fully refilled and is not in use."""
+        now = time.monotonic()
+        full_after = self.capacity / self.refill_per_second
+
+        for channel_id, (_, updated) in list(self._buckets.items()):
+            lock = self._locks.get(channel_id)
+            if now - updated >= full_after and (lock is None or not lock.locked()):
+                del self._buckets[channel_id]
+                self._locks.pop(channel_id, None)
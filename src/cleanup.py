@@ -129,7 +129,7 @@ class Cleanup:
             self.logger.info("Starting LLM resource cleanup...")
 
             # Stop queue worker FIRST and give it time to fully terminate
-            if hasattr(self.bot, 'queue_worker') and self.bot.queue_worker:
+            if self.bot.queue_worker is not None:
                 self.logger.info("Stopping conversation queue worker with extended timeout...")
                 try:
                     # Use a longer timeout for queue worker shutdown
@@ -183,7 +183,7 @@ class Cleanup:
                     self.logger.warning(f"Error unloading model '{model_name}': {e}")
 
             # Clear DMAssistant reference
-            if hasattr(self.bot, 'dm_assistant') and self.bot.dm_assistant:
+            if self.bot.dm_assistant is not None:
                 self.bot.dm_assistant = None
                 self.logger.info("DMAssistant reference cleared")
 
@@ -252,23 +252,20 @@ class Cleanup:
             self.logger.info("Starting pipeline resource cleanup...")
 
             # Clear message pipeline reference and stop processing
-            if hasattr(self.bot, 'message_pipeline') and self.bot.message_pipeline:
+            if self.bot.message_pipeline is not None:
                 self.bot.message_pipeline = None
                 self.logger.info("Message pipeline reference cleared")
 
             # Clear pipeline ready event
-            if hasattr(self.bot, 'pipeline_ready'):
-                self.bot.pipeline_ready.clear()
-                self.logger.info("Pipeline events cleared")
+            self.bot.pipeline_ready.clear()
+            self.logger.info("Pipeline events cleared")
 
             # Clear any stored message references
-            if hasattr(self.bot, 'stored_messages'):
-                self.bot.stored_messages.clear()
-                self.logger.info("Stored messages cleared")
+            self.bot.stored_messages.clear()
+            self.logger.info("Stored messages cleared")
 
-            if hasattr(self.bot, 'processed_channels'):
-                self.bot.processed_channels.clear()
-                self.logger.info("Processed channels list cleared")
+            self.bot.processed_channels.clear()
+            self.logger.info("Processed channels list cleared")
 
             self.components_cleaned.append("pipeline")
             self.logger.info("Pipeline resource cleanup completed successfully")
@@ -5,7 +5,7 @@ Discord messages through various stages including embedding, extraction,
 metadata preparation, and storage.
 """
 
-from src.message_processing.processor import MessagePipeline
+from src.message_processing.processor import MIN_INDEXABLE_CONTENT_LENGTH, MessagePipeline
 
-__all__ = ['MessagePipeline']
+__all__ = ['MessagePipeline', 'MIN_INDEXABLE_CONTENT_LENGTH']
 
@@ -20,6 +20,10 @@ from src.setup import get_server_config
 
 logger = logging.getLogger(__name__)
 
+# Text-only messages shorter than this (after stripping) are not worth embedding.
+# Shared by historical, resume and real-time indexing so all paths index the same messages.
+MIN_INDEXABLE_CONTENT_LENGTH = 2
+
 
 class MessagePipeline:
     """Main message processing pipeline class.
@@ -63,7 +67,7 @@ class MessagePipeline:
             'has_images': len(attachments) > 0,
             'has_urls': 'http' in content.lower(),
             'has_mentions': '@' in content or '#' in content,
-            'is_empty': not content.strip() and len(attachments) == 0
+            'is_empty': len(content.strip()) < MIN_INDEXABLE_CONTENT_LENGTH and len(attachments) == 0
         }
         
         logger.debug(f"Content analysis: {content_analysis}")
@@ -183,9 +187,9 @@ class MessagePipeline:
                     # Analyze message content to determine processing requirements
                     content_analysis = self._check_message_content(message_data)
                     
-                    # Skip empty messages
+                    # Skip messages with no indexable content
                     if content_analysis['is_empty']:
-                        logger.info("Skipping empty message")
+                        logger.info("Skipping message with no indexable content")
                         continue
                     
                     # Route message through appropriate processing steps
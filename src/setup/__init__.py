@@ -7,6 +7,7 @@ including terminal UI interaction and persistent storage management.
 from .server_setup import (
     load_configured_servers,
     is_server_configured,
+    filter_configured_servers,
     get_server_config,
     ensure_server_configured,
     configure_all_servers
@@ -15,6 +16,7 @@ from .server_setup import (
 __all__ = [
     'load_configured_servers',
     'is_server_configured',
+    'filter_configured_servers',
     'get_server_config',
     'ensure_server_configured',
     'configure_all_servers'
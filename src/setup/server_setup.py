@@ -6,15 +6,15 @@ interaction and persistent configuration storage using SQLite with in-memory cac
 
 import logging
 import sqlite3
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set
 from datetime import datetime
 
 from src.db.setup_db import get_config_db
 
 logger = logging.getLogger(__name__)
 
-# Global cache of configured server IDs for fast lookup
-_configured_servers: List[str] = []
+# Global cache of configured server IDs for fast lookup (set: O(1) per-message checks)
+_configured_servers: Set[str] = set()
 
 
 
@@ -29,14 +29,14 @@ def load_configured_servers() -> List[str]:
     try:
         with get_config_db() as conn:
             cursor = conn.execute("SELECT server_id FROM server_configs")
-            _configured_servers = [row[0] for row in cursor.fetchall()]
+            _configured_servers = {row[0] for row in cursor.fetchall()}
             
         logger.info(f"Loaded {len(_configured_servers)} configured servers into cache")
-        return _configured_servers
+        return list(_configured_servers)
         
     except sqlite3.Error as e:
         logger.error(f"Failed to load configured servers: {e}")
-        _configured_servers = []
+        _configured_servers = set()
         return []
 
 
@@ -52,6 +52,18 @@ def is_server_configured(server_id: str) -> bool:
     return server_id in _configured_servers
 
 
+def filter_configured_servers(server_ids: Iterable[str]) -> Set[str]:
+    """Return which of the given servers are configured, in one cache lookup.
+    
+    Args:
+        server_ids: Discord server/guild IDs to check
+        
+    Returns:
+        Set of the given server IDs that are configured
+    """
+    return _configured_servers.intersection(server_ids)
+
+
 def get_server_config(server_id: str) -> Optional[Dict[str, Any]]:
     """Get configuration for a specific server.
     
@@ -197,7 +209,7 @@ def add_server_to_cache(server_id: str) -> None:
     global _configured_servers
     
     if server_id not in _configured_servers:
-        _configured_servers.append(server_id)
+        _configured_servers.add(server_id)
         logger.info(f"Added server {server_id} to configured servers cache")
 
 